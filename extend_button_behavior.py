@@ -2,6 +2,16 @@ from kivy.uix.behaviors.button import ButtonBehavior
 from kivy.properties import BooleanProperty
 from kivy.core.window import Window
 
+from mouse_dispatcher import MousePosDispatcher
+
+
+def _dispatch_hover(widgets, pos):
+    for widget in widgets:
+        widget.on_mouse_pos(Window, pos)
+
+
+_dispatcher = MousePosDispatcher(_dispatch_hover)
+
 
 class ExtendedButtonBehavior(ButtonBehavior):
     """Extends the class `ButtonBehavior`.
@@ -15,21 +25,37 @@ class ExtendedButtonBehavior(ButtonBehavior):
 
             The calling class can bind to this Kivy property to create, for example,
             a background change on hover.
+
+        Note
+        ----
+
+        All instances share a single `Window.mouse_pos` binding through a
+        `mouse_dispatcher.MousePosDispatcher`. An instance is registered while it
+        has a parent and is removed when it is detached.
     """
 
     hover = BooleanProperty(False)
 
-    def __init__(self, *args, **kwargs):
-        Window.bind(mouse_pos=self.on_mouse_pos)
-        super(ExtendedButtonBehavior, self).__init__(*args, **kwargs)
+    def on_parent(self, instance, parent):
+        """Register with the dispatcher while `self` is in a widget tree."""
+
+        if parent is None:
+            _dispatcher.discard(self)
+            self.hover = False
+        else:
+            _dispatcher.add(self)
 
     def on_mouse_pos(self, *args):
-        if not self.get_root_window():
-            return
+        x, y = self.to_widget(*args[1])
 
-        pos = args[1]
+        # Inline bounding box test; cheaper than a `collide_point` method call.
+        hover = self.x <= x <= self.right and self.y <= y <= self.top
 
-        if self.collide_point(*self.to_widget(*pos)):
-            self.hover = True
-        else:
-            self.hover = False
+        # A widget in a tree that isn't on the window can't be hovered. Only hits
+        # pay for walking the parent chain.
+        if hover and not self.get_root_window():
+            hover = False
+
+        # Only write on a transition to avoid a needless property dispatch.
+        if hover != self.hover:
+            self.hover = hover
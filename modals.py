@@ -3,8 +3,7 @@ from kivy.uix.popup import Popup
 from kivy.uix.label import Label
 from kivy.properties import ObjectProperty
 from kivy.lang import Builder
-
-from icons.iconfonts import register
+from kivy.resources import resource_find
 
 from typography import Li
 from extend_button_behavior import ExtendedButtonBehavior
@@ -22,17 +21,70 @@ from extend_button_behavior import ExtendedButtonBehavior
 
         * `extend_button_behavior`
 
+        * `mouse_dispatcher`
+
         * `icons`
+
+    Note
+    ----
+
+        `modals.kv` is loaded on import, so that an app's own kv rules, loaded
+        later, still override its `<Dialog>`, `<CloseButton>` and `<ModalBtnClose>`
+        rules. `typography.kv` is loaded when the first modal is instantiated.
 """
 
-Builder.load_file('modals.kv')
-Builder.load_file('typography.kv')
-register('default_font', 'icons/fontawesome-webfont.ttf', 'icons/font-awesome.fontd')
+_loaded = False
+
+
+def _load_kv(filename):
+    """Load `filename` with `Builder` unless it has already been loaded.
+
+        `Builder` keeps the resolved path of every file it has parsed. Loading a
+        file twice re-parses it and duplicates its rules.
+    """
+
+    if (resource_find(filename) or filename) not in Builder.files:
+        Builder.load_file(filename)
+
+
+def _ensure_loaded():
+    """Load `typography.kv` the first time a modal is created."""
+
+    global _loaded
+
+    if _loaded:
+        return
+
+    _load_kv('typography.kv')
+    _loaded = True
+
+
+_load_kv('modals.kv')
+
+
+def _title_label(popup):
+    """Return the `Label` in the title bar of `popup`.
+
+        The label is looked up by type and text instead of by its position in the
+        `Popup` template, and is cached on `popup`.
+    """
+
+    label = getattr(popup, '_title_label', None)
+
+    if label is None:
+        label = next(c for c in popup.walk(restrict=True)
+                     if isinstance(c, Label) and c.text == popup.title)
+        popup._title_label = label
+
+    return label
 
 
 class CloseButton(ExtendedButtonBehavior, Label):
     """This widget uses an icon and to display a button with a hover effect."""
-    pass
+
+    def __init__(self, *args, **kwargs):
+        _ensure_loaded()
+        super(CloseButton, self).__init__(*args, **kwargs)
 
 
 class Dialog(Popup):
@@ -81,19 +133,21 @@ class Dialog(Popup):
                  icon_size="12sp",
                  *args, **kwargs):
 
+        _ensure_loaded()
         super(Dialog, self).__init__(*args, **kwargs)
         self.title = title
         self.title_align = 'center'
         self.title_size = '18sp'
 
-        # Hack: Enable markup on the the title Label.
-        self.children[0].children[2].markup = True
+        _title_label(self).markup = True
 
-        for msg in messages:
-            self.grid.add_widget(Li(text=msg,
-                                    ico=ico,
-                                    icon_color=icon_color,
-                                    icon_size=icon_size))
+        items = [Li(text=msg, ico=ico, icon_color=icon_color, icon_size=icon_size)
+                 for msg in messages]
+
+        grid = self.grid
+
+        for item in items:
+            grid.add_widget(item)
 
 
 class LoadingModal(ModalView):
@@ -104,7 +158,10 @@ class LoadingModal(ModalView):
 
         The layout is defing in `modals.kv`.
     """
-    pass
+
+    def __init__(self, *args, **kwargs):
+        _ensure_loaded()
+        super(LoadingModal, self).__init__(*args, **kwargs)
 
 
 class ModalBtnClose(ModalView):
@@ -131,6 +188,7 @@ class ModalBtnClose(ModalView):
     # icon_color = StringProperty(None)
 
     def __init__(self, msg, ico="fa-circle", icon_color="20c100", *args, **kwargs):
+        _ensure_loaded()
         self.msg = msg
         self.ico = ico
         self.icon_color = icon_color
@@ -144,6 +202,7 @@ class ContentModal(Popup):
     modal_content = ObjectProperty(None)
 
     def __init__(self, modal_content=None, title="", *args, **kwargs):
+        _ensure_loaded()
         self.modal_content = modal_content
 
         super(ContentModal, self).__init__(*args, **kwargs)
@@ -153,8 +212,7 @@ class ContentModal(Popup):
         self.title_align = 'center'
         self.title_size = '18sp'
 
-        # Hack: Enable markup on the the title Label.
-        self.children[0].children[2].markup = True
+        _title_label(self).markup = True
 
 
 if __name__ == '__main__':
@@ -0,0 +1,107 @@
+"""
+    MouseDispatcher
+    ===============
+
+    A module that lets many hoverable widgets share a single `Window.mouse_pos`
+    binding.
+
+    Binding `Window.mouse_pos` once per widget means every mouse move runs one
+    Python callback per widget. A :class:`MousePosDispatcher` binds once, keeps
+    its widgets in a `weakref.WeakSet` so they can still be collected, and
+    coalesces mouse events with a `Clock` trigger so that at most one hover pass
+    runs per frame.
+
+    Used by `extend_button_behavior` and `tooltip`.
+"""
+
+import weakref
+
+from kivy.core.window import Window
+from kivy.clock import Clock
+
+
+class MousePosDispatcher(object):
+    """Dispatches the latest mouse position to a set of registered widgets.
+
+        Attributes
+        ----------
+
+        callback : callable
+            Called as `callback(widgets, pos)` with a list of the registered
+            widgets and the last mouse position. Returns whether one of the
+            widgets is hovered.
+
+        widgets : weakref.WeakSet
+            The registered widgets.
+
+        mouse_pos : tuple of float
+            The last position received from `Window`.
+
+        last_pos : tuple of float
+            The position of the last dispatch, or `None`.
+
+        hovered : bool
+            The result of the last call to `callback`.
+
+        Parameters
+        ----------
+
+        callback : callable
+            Required.
+
+        timeout : float
+            Optional. Seconds to wait before dispatching. Defaults to one frame
+            at 60 fps.
+
+        min_distance : float
+            Optional. While no widget is hovered, moves of less than
+            `min_distance` pixels since the last dispatch are ignored. Defaults
+            to 0.
+    """
+
+    def __init__(self, callback, timeout=.016, min_distance=0):
+        self.callback = callback
+        self.timeout = timeout
+        self.min_distance = min_distance
+        self.widgets = weakref.WeakSet()
+        self.mouse_pos = None
+        self.last_pos = None
+        self.hovered = False
+        self._trigger = None
+        self._bound = False
+
+    def add(self, widget):
+        """Register `widget`, binding `Window.mouse_pos` if needed."""
+
+        self.widgets.add(widget)
+
+        if not self._bound:
+            if self._trigger is None:
+                self._trigger = Clock.create_trigger(self._dispatch, self.timeout)
+            Window.fbind("mouse_pos", self._on_mouse_pos)
+            self._bound = True
+
+    def discard(self, widget):
+        """Unregister `widget`, dropping the `Window` binding when none are left."""
+
+        self.widgets.discard(widget)
+
+        if self._bound and not self.widgets:
+            Window.funbind("mouse_pos", self._on_mouse_pos)
+            self._trigger.cancel()
+            self._bound = False
+
+    def _on_mouse_pos(self, window, pos):
+        self.mouse_pos = pos
+        self._trigger()
+
+    def _dispatch(self, *args):
+        pos = self.mouse_pos
+        last = self.last_pos
+
+        if (last is not None and not self.hovered and
+                abs(pos[0] - last[0]) + abs(pos[1] - last[1]) < self.min_distance):
+            return
+
+        self.last_pos = pos
+        self.hovered = bool(self.callback(list(self.widgets), pos))
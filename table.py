@@ -34,6 +34,8 @@
 
         * `tooltip` module
 
+        * `mouse_dispatcher` module
+
     Parameters
     ----------
 
@@ -74,8 +76,8 @@
                     data = []
                     pre_selected_rows = sample(range(30), 10)
 
-                    rand_row = sample(range(30), 10)
-                    rand_col = sample(range(15), 5)
+                    rand_row = set(sample(range(30), 10))
+                    rand_col = set(sample(range(15), 5))
 
                     keys = ["Title Col: {}".format(i) for i in range(15)]
 
@@ -94,6 +96,9 @@
             TableApp().run()
 """
 
+from collections.abc import Mapping
+from itertools import islice
+
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.recycleview import RecycleView
 from kivy.uix.recycleview.views import RecycleDataViewBehavior
@@ -101,10 +106,11 @@ from kivy.uix.behaviors import FocusBehavior
 from kivy.uix.recycleview.layout import LayoutSelectionBehavior
 from kivy.uix.recyclegridlayout import RecycleGridLayout
 from kivy.properties import ObjectProperty, StringProperty
-from kivy.properties import BooleanProperty, ListProperty
+from kivy.properties import BooleanProperty, ListProperty, AliasProperty
 from kivy.core.window import Window
+from kivy.clock import Clock
 
-from tooltip import ToolTipLabel, ToolTip
+from tooltip import ToolTipLabel, close_active_tooltip
 
 
 class Cell(ToolTipLabel):
@@ -135,9 +141,7 @@ class Cell(ToolTipLabel):
         super(Cell, self).__init__(*args, **kwargs)
 
     def on_pos(self, instance, value):
-        for child in Window.children:
-            if type(child) == ToolTip:
-                Window.remove_widget(child)
+        close_active_tooltip()
 
 
 class SelectableDataCell(RecycleDataViewBehavior, Cell):
@@ -183,7 +187,7 @@ class SelectableDataCell(RecycleDataViewBehavior, Cell):
 
         # Need to set self.selected before the rv.data is sent to the view and
         # adds the node to super's self.selected_nodes via select_node(self.index)
-        if data['selected'] is True:
+        if data['selected']:
             setattr(self, 'selected', True)
             rv.grid.select_node(self.index)
 
@@ -233,9 +237,24 @@ class SelectableDataCell(RecycleDataViewBehavior, Cell):
             is_selected : BooleanProperty
         """
 
+        # The layout calls this for every view it refreshes, so no-op selections
+        # are common while scrolling.
+        if (self.selected == is_selected and
+                rv.data[index]['selected'] == is_selected and
+                (index in rv.selected_set) == is_selected):
+            return
+
         self.selected = is_selected
         rv.data[index]['selected'] = self.selected
-        rv.selected_cells = [i for i, row in enumerate(rv.data) if row['selected'] is True]
+
+        if is_selected:
+            rv.selected_set.add(index)
+        else:
+            rv.selected_set.discard(index)
+
+        # Only dispatches, and cascades into `Table.on_selected_rows`, if the
+        # selection changed.
+        rv.property('selected_cells').trigger_change(rv, None)
 
 
 class SelectableRecycleGridLayout(FocusBehavior, LayoutSelectionBehavior, RecycleGridLayout):
@@ -243,27 +262,136 @@ class SelectableRecycleGridLayout(FocusBehavior, LayoutSelectionBehavior, Recycl
 
     def __init__(self, *args, **kwargs):
         super(SelectableRecycleGridLayout, self).__init__(*args, **kwargs)
-        self.fbind('children', self.hover_on_scroll)
 
-    def hover_on_scroll(self, instance, children):
+        # `children` changes many times per frame while scrolling.
+        self._hover_trigger = Clock.create_trigger(self.hover_on_scroll, 0)
+        self.fbind('children', self._hover_trigger)
+
+    def hover_on_scroll(self, *args):
         """This method updates the hover property when the mouse is not
-            moving but the scrollview is.
+            moving but the scrollview is. It runs at most once per frame.
+
+            The view under the mouse is found from its data index, so only one
+            coordinate conversion is done instead of one per visible child.
+            `get_view_index_at` clamps points outside the layout to the nearest
+            row, so the view is hit-tested before it is marked as hovered.
         """
 
-        for ch in children:
-            if ch.collide_point(*ch.to_widget(*Window.mouse_pos)):
+        local_pos = self.to_widget(*Window.mouse_pos)
+        index = self.get_view_index_at(local_pos)
+        hovered = self.recycleview.view_adapter.get_visible_view(index)
+
+        if hovered is not None and not hovered.collide_point(*local_pos):
+            hovered = None
+
+        for ch in self.children:
+            if ch is hovered:
                 ch.hover = True
-            else:
+            elif ch.hover:
                 ch.hover = False
 
 
 class FirstColRv(RecycleView):
-    """A RecycleView based class that adds the attribute:
+    """A RecycleView based class that adds the attributes:
 
-        selected_cells : ListProperty
-            A kivy property that can respond to changes with a callback.
+        selected_cells : AliasProperty
+            A kivy property that can respond to changes with a callback. It is the
+            sorted list of `selected_set` and is only rebuilt when the property is
+            triggered or set.
+
+        selected_set : set of int
+            The indexes of the selected cells. `SelectableDataCell.apply_selection`
+            updates it incrementally.
     """
-    selected_cells = ListProperty([])
+
+    def __init__(self, *args, **kwargs):
+        self.selected_set = set()
+        super(FirstColRv, self).__init__(*args, **kwargs)
+
+    def _get_selected_cells(self):
+        return sorted(self.selected_set)
+
+    def _set_selected_cells(self, value):
+        self.selected_set = set(value)
+        return True
+
+    selected_cells = AliasProperty(_get_selected_cells, _set_selected_cells, cache=True)
+
+
+class MainTableData(object):
+    """Struct-of-arrays storage for the cells of `main_table_rv`.
+
+        Attributes
+        ----------
+
+        texts : list of str
+            The text of every cell, row by row.
+
+        cols : int
+            The number of columns, less the first column.
+
+        selected_rows : set of int
+            The indexes of the selected rows.
+    """
+
+    def __init__(self, texts, cols):
+        self.texts = texts
+        self.cols = cols
+        self.selected_rows = set()
+
+
+class CellData(Mapping):
+    """A read-only mapping over a single cell of a `MainTableData`.
+
+        `RecycleView` only reads the items of its `data` list, so a light view
+        stands in for a dict per cell. `row`, `is_even` and `selected` are derived
+        from the cell's index. Items can't be assigned; change the
+        `MainTableData` instead and call `main_table_rv.refresh_from_data()`.
+
+        `RecycleLayout` probes every item with `get` for sizing keys that a cell
+        never has, so `get` and `__contains__` check the key set before
+        `__getitem__` is reached.
+    """
+
+    __slots__ = ('_store', '_index')
+
+    _keys = ('text', 'is_even', 'selected', 'row')
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key):
+        store = self._store
+
+        if key == 'text':
+            return store.texts[self._index]
+
+        row = self._index // store.cols
+
+        if key == 'row':
+            return row
+        if key == 'is_even':
+            return (row & 1) == 0
+        if key == 'selected':
+            return row in store.selected_rows
+
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        return self[key] if key in _CELL_KEYS else default
+
+    def __contains__(self, key):
+        return key in _CELL_KEYS
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+_CELL_KEYS = frozenset(CellData._keys)
 
 
 class Table(GridLayout):
@@ -296,6 +424,11 @@ class Table(GridLayout):
             `main_table_rv` : ObjectProperty
                 A kivy property referencing the `MainTableRv` object instantiated by `Table`.
                 The `MainTableRv` layout object is defined in `table.kv`.
+
+            `main_table_data` : MainTableData
+                The storage behind the `CellData` items of `main_table_rv.data`.
+                The items are read-only; edit `main_table_data.texts` and call
+                `main_table_rv.refresh_from_data()` to change a cell.
     """
 
     selected_rows = ListProperty([])
@@ -314,74 +447,122 @@ class Table(GridLayout):
         self.list_dicts = list_dicts
         self.pre_selected_rows = pre_selected_rows
 
+        self.main_table_data = None
+
+        # Set while one scroll callback updates another widget's scroll.
+        self._scroll_lock = False
+
         if list_dicts:
-            self.first_col_header = list_dicts[0].items()[0][0]
-            self.set_first_col_data(list_dicts)
-            self.set_table_headers(list_dicts)
-            self.set_main_table_data(list_dicts)
+            self.first_col_header = next(iter(list_dicts[0]))
 
             # Bind self.selected_rows to first_col_rv.selected_cells
-            self.first_col_rv.bind(selected_cells=self.setter('selected_rows'))
+            self.first_col_rv.fbind('selected_cells', self.setter('selected_rows'))
 
             # Bind scroll behaviors of header, first column and table.
             self.main_table_rv.fbind('scroll_x', self.scroll_with_header)
             self.first_col_rv.fbind('scroll_y', self.scroll_with_first_col)
             self.main_table_rv.fbind('scroll_y', self.scroll_with_data)
 
+            # The data is set now so that `selected_rows` and `main_table_data` are
+            # ready on return. `RecycleView` builds its views on a later frame anyway.
+            # The main table goes first so that `pre_selected_rows` reaches it
+            # through `on_selected_rows`.
+            self.set_main_table_data(list_dicts)
+            self.set_first_col_data(list_dicts)
+
+            # Add the header cells on the next frame so the layout is shown first.
+            Clock.schedule_once(lambda dt: self.set_table_headers(self.list_dicts))
+
     def set_first_col_data(self, list_dicts):
-        """Appends values to the `data` property of the `first_col_rv` object."""
+        """Sets the `data` property of the `first_col_rv` object.
 
-        for row_num, dct in enumerate(list_dicts):
-            text = dct.values()[0]
+            The list is built locally and assigned once so that `RecycleView`
+            dispatches a single data change.
+        """
+
+        pre_selected = set(self.pre_selected_rows)
+        first_key = next(iter(list_dicts[0]))
+
+        data = [{'text': text if text is not None else " ",
+                 'is_even': (row_num & 1) == 0,
+                 'selected': row_num in pre_selected, }
+                for row_num, text in enumerate(d[first_key] for d in list_dicts)]
 
-            self.first_col_rv.data.append(
-                {'text': text if text is not None else " ",
-                 'is_even': True if row_num % 2 is 0 else False,
-                 'selected': row_num in self.pre_selected_rows, }
-            )
+        self.first_col_rv.selected_cells = pre_selected.intersection(range(len(data)))
+        self.first_col_rv.data = data
 
     def set_table_headers(self, list_dicts):
         """Adds `Cell` widgets to the `GridLayout` child of `table_header_scrlv`."""
 
+        titles = iter(list_dicts[0])
+
         # Less the first column key.
-        for title in list_dicts[0].keys()[1:]:
-            self.table_header_scrlv.grid.add_widget(Cell(text=title))
+        next(titles)
+
+        cells = [Cell(text=title) for title in titles]
+
+        grid = self.table_header_scrlv.grid
+
+        for cell in cells:
+            grid.add_widget(cell)
 
     def set_main_table_data(self, list_dicts):
-        """Appends values to the `data` property of the `main_table_rv` object."""
+        """Sets the `data` property of the `main_table_rv` object.
+
+            The cell texts are stored once in a `MainTableData` and `main_table_rv.data`
+            holds a `CellData` view per cell. The list is built locally and assigned
+            once so that `RecycleView` dispatches a single data change.
+        """
 
-        self.main_table_rv.grid.cols = len(list_dicts[0]) - 1
+        cols = len(list_dicts[0]) - 1
+        self.main_table_rv.grid.cols = cols
 
-        for row_num, ord_dict in enumerate(list_dicts):
+        # Less the first column value of each row.
+        texts = [text if text is not None else " "
+                 for ord_dict in list_dicts
+                 for text in islice(ord_dict.values(), 1, None)]
 
-            for text in ord_dict.values()[1:]:
-                self.main_table_rv.data.append(
-                    {'text': text if text is not None else " ",
-                     'is_even': True if row_num % 2 is 0 else False,
-                     "selected": False,
-                     "row": row_num, }
-                )
+        self.main_table_data = store = MainTableData(texts, cols)
+        self.main_table_rv.data = [CellData(store, i) for i in range(len(texts))]
+
+    def _sync_scroll(self, target, name, value):
+        """Set the scroll attribute `name` of `target` without re-entering the
+            scroll callbacks that the assignment dispatches.
+        """
+
+        if self._scroll_lock:
+            return
+
+        self._scroll_lock = True
+
+        try:
+            setattr(target, name, value)
+        finally:
+            self._scroll_lock = False
 
     def scroll_with_header(self, obj, value):
-        self.table_header_scrlv.scroll_x = value
+        self._sync_scroll(self.table_header_scrlv, 'scroll_x', value)
 
     def scroll_with_data(self, obj, value):
-        self.first_col_rv.scroll_y = value
+        self._sync_scroll(self.first_col_rv, 'scroll_y', value)
 
     def scroll_with_first_col(self, obj, value):
-        self.main_table_rv.scroll_y = value
+        self._sync_scroll(self.main_table_rv, 'scroll_y', value)
 
     def on_selected_rows(self, instance, row_nums):
-        """Synx main_table_rv cells' selected state with self.selected_rows."""
+        """Synx main_table_rv cells' selected state with self.selected_rows.
+
+            The selected state of every cell is derived from
+            `main_table_data.selected_rows`, so only that set needs replacing.
+        """
+
+        store = self.main_table_data
+        selected = set(row_nums)
 
-        # could probable keep track of the previous list of indexes, get the diff with new list of
-        # indexes and set accordingly instead of looping through the whole data set
-        for d in self.main_table_rv.data:
-            if d["row"] in row_nums:
-                d["selected"] = True
-            else:
-                d["selected"] = False
+        if store is None or selected == store.selected_rows:
+            return
 
+        store.selected_rows = selected
         self.main_table_rv.refresh_from_data()
 
 
@@ -399,8 +580,8 @@ if __name__ == '__main__':
             data = []
             pre_selected_rows = sample(range(30), 10)
 
-            rand_row = sample(range(30), 10)
-            rand_col = sample(range(15), 5)
+            rand_row = set(sample(range(30), 10))
+            rand_col = set(sample(range(15), 5))
 
             keys = ["Title Col: {}".format(i) for i in range(15)]
 
@@ -20,6 +20,25 @@ from icons.iconfonts import icon
 """
 
 
+_titles = None
+
+
+def _spinner_titles():
+    """Return the `open_text` and `close_text` markup shared by every `ToggleSpinner`.
+
+        The result is computed on first use, after the icon font is registered.
+    """
+
+    global _titles
+
+    if _titles is None:
+        ico_down = u"{}".format(icon('fa-toggle-down', '16sp', "20c100"))
+        ico_up = u"{}".format(icon('fa-toggle-up', '16sp', "4d8cf5"))
+        _titles = ico_down + "  Choose From List.", ico_up + "  Close."
+
+    return _titles
+
+
 class ToggleSpinner(Spinner):
     """A spinner/dropdown widget that utilizes togglebuttons.
 
@@ -52,10 +71,10 @@ class ToggleSpinner(Spinner):
 
     def __init__(self, *args, **kwargs):
 
-        ico_down = u"{}".format(icon('fa-toggle-down', '16sp', "20c100"))
-        ico_up = u"{}".format(icon('fa-toggle-up', '16sp', "4d8cf5"))
-        self.open_text = ico_down + "  Choose From List."
-        self.close_text = ico_up + "  Close."
+        self.open_text, self.close_text = _spinner_titles()
+
+        # Maps the text of each dropdown button to the button.
+        self._btn_by_text = {}
 
         super(ToggleSpinner, self).__init__(*args, **kwargs)
         self.option_cls = "SpinnerBtns"
@@ -66,6 +85,19 @@ class ToggleSpinner(Spinner):
         spinner_scroll.bar_color = [0.2, 0.7, 0.9, 1]
         spinner_scroll.bar_inactive_color = [0.2, 0.7, 0.9, .5]
 
+    def _update_dropdown(self, *largs):
+        """Rebuild the dropdown buttons and the text to button lookup.
+
+            Note
+            ----
+
+            This method overrides the inherited method from kivy.uix.spinner, which
+            is called whenever `values` or `option_cls` changes.
+        """
+
+        super(ToggleSpinner, self)._update_dropdown(*largs)
+        self._btn_by_text = {btn.text: btn for btn in self._dropdown.container.children}
+
     def _on_dropdown_select(self, dropdown_obj, data, *largs):
         """A callback to correctly handle toggle buttons within a spinner dropdown.
 
@@ -90,7 +122,12 @@ class ToggleSpinner(Spinner):
                 The text value of the togglebutton.
         """
 
-        self.cur_button = [btn for btn in dropdown_obj.children[0].children if btn.text == data][0]
+        btn = self._btn_by_text.get(data)
+
+        if btn is None:
+            btn = next((b for b in dropdown_obj.children[0].children if b.text == data), None)
+
+        self.cur_button = btn
         self.is_open = False
 
         if self.val == data:
@@ -11,6 +11,9 @@
 
     This doesn't inherit from HoverBehavior so that collide_point isn't
     called twice.
+
+    All `ToolTipLabel` instances that have a parent share a single
+    `Window.mouse_pos` binding through a `mouse_dispatcher.MousePosDispatcher`.
 """
 
 from kivy.uix.label import Label
@@ -21,12 +24,108 @@ from kivy.uix.bubble import Bubble
 from kivy.metrics import dp
 from kivy.uix.widget import Widget
 
+from mouse_dispatcher import MousePosDispatcher
+
+
+_tooltip = None
+
+
+def get_tooltip():
+    """Return the `ToolTip` shared by every `ToolTipLabel`, creating it on first use."""
+
+    global _tooltip
+
+    if _tooltip is None:
+        _tooltip = ToolTip(text="")
+
+    return _tooltip
+
+
+def close_active_tooltip():
+    """Remove the shared tooltip from `Window` if it is displayed."""
+
+    if _tooltip is not None and _tooltip.parent is not None:
+        Window.remove_widget(_tooltip)
+
+        if _tooltip.owner is not None:
+            _tooltip.owner.tooltip = None
+            _tooltip.owner._win_pos = None
+            _tooltip.owner = None
+
+
+def _dispatch_hover(labels, pos):
+    """Dispatch the mouse position to the registered `ToolTipLabel`s.
+
+        Hit-testing stops at the first label under the mouse; the rest only have
+        a stale `hover`, and any tooltip it scheduled, cleared.
+
+        Labels are grouped by parent: the mouse position is converted into each
+        parent's coordinate space, and its root window checked, once, rather
+        than once per label.
+
+        Returns whether a label is hovered.
+    """
+
+    local_pos = {}
+    found = False
+
+    close_active_tooltip()
+
+    for label in labels:
+        if found:
+            if label.hover:
+                label._update_hover(False)
+            continue
+
+        parent = label.parent
+
+        if parent is None:
+            continue
+
+        if parent not in local_pos:
+            local_pos[parent] = parent.to_widget(*pos) if parent.get_root_window() else None
+
+        parent_pos = local_pos[parent]
+
+        if parent_pos is not None:
+            x, y = parent_pos
+            found = label._update_hover(label.x <= x <= label.right and label.y <= y <= label.top)
+
+    return found
+
+
+# Jitter of less than 2 pixels is ignored while no label is hovered.
+_dispatcher = MousePosDispatcher(_dispatch_hover, min_distance=2)
+
 
 class ToolTip(Bubble):
-    """A bubble widget that contains a label."""
+    """A bubble widget that contains a label.
+
+        A single instance is shared, see `get_tooltip`.
+
+        Attributes
+        ----------
+
+        `owner` : ToolTipLabel
+            The label the tooltip is currently displayed for. It positions the
+            tooltip whenever the size of `label` changes.
+    """
     text = StringProperty(None)
     label = ObjectProperty(None)
 
+    def __init__(self, *args, **kwargs):
+        super(ToolTip, self).__init__(*args, **kwargs)
+        self.owner = None
+
+        # Centers the arrow on the first line of a multi-line tooltip.
+        self.spacer = Widget(size_hint_y=None, height=dp(4))
+
+        self.label.fbind("size", self._on_label_size)
+
+    def _on_label_size(self, instance, size):
+        if self.owner is not None:
+            self.owner.set_position(instance, size)
+
 
 class ToolTipLabel(Label):
     """A `Label` based widget that adds a tooltip on haver if it's
@@ -38,51 +137,62 @@ class ToolTipLabel(Label):
         `hover` : BooleanProperty
             A property that can be used when the mouse is over a ToolTipLable instance.
 
-        'tooltip' : None
-            Initialized in init for clarity. To be reassigned if text is shortend.
+        'tooltip' : ToolTip
+            The shared tooltip (see `get_tooltip`) while it is displayed for this
+            label, otherwise `None`.
     """
 
     hover = BooleanProperty(False)
 
     def __init__(self, *args, **kwargs):
-        Window.fbind("mouse_pos", self.on_mouse_pos)
-
         super(ToolTipLabel, self).__init__(*args, **kwargs)
         self.tooltip = None
+        self._win_pos = None
         self.trigger_tp = Clock.create_trigger(self.display_tooltip)
 
-    def on_mouse_pos(self, window, pos):
-        """A callback called when the mouse position is over the widget.
+    def on_parent(self, instance, parent):
+        """Register with the dispatcher while `self` is in a widget tree.
 
-            If the mouse is within the `Cell`'s bounding box, trigger_tp
-            is scheduled for the next `Clock` cycle.
+            `RecycleView` detaches views that scroll out of sight and keeps them
+            for reuse; a detached view is dropped from the dispatcher and its
+            hover state is reset.
+        """
 
-            Parameters
-            ----------
+        if parent is None:
+            _dispatcher.discard(self)
+            self.trigger_tp.cancel()
+            self.hover = False
+        else:
+            _dispatcher.add(self)
 
-            `pos` : tuple of float
-                Position of the mouse when the event is triggered.
-        """
+    def _update_hover(self, hover):
+        """Set `hover` and schedule the tooltip if the text is shortened."""
 
-        if not self.get_root_window():
-            return
+        self.hover = hover
 
-        Window.remove_widget(self.tooltip)
+        if not hover:
+            # Drop a tooltip that was scheduled while the mouse was still over `self`.
+            self.trigger_tp.cancel()
+        elif self.is_shortened:
+            self.trigger_tp()
 
-        if self.collide_point(*self.to_widget(*pos)):
+        return hover
 
-            self.hover = True
+    def display_tooltip(self, *args):
+        close_active_tooltip()
 
-            if self.is_shortened:
-                self.trigger_tp()
+        # `set_position` runs on every size change of the tooltip's label, so the
+        # window position of `self` is computed once per display.
+        self._win_pos = self.to_window(self.pos[0], self.pos[1], relative=False)
 
-        else:
-            self.hover = False
+        self.tooltip = tooltip = get_tooltip()
+        tooltip.owner = self
+        tooltip.text = self.text
 
-    def display_tooltip(self, *args):
-        self.tooltip = ToolTip(text=self.text)
-        self.tooltip.label.fbind("size", self.set_position)
-        Window.add_widget(self.tooltip)
+        # The label size only changes, and calls `set_position`, if the new text
+        # needs a different size than the previous one.
+        self.set_position(tooltip.label, tooltip.label.size)
+        Window.add_widget(tooltip)
 
     def set_position(self, instance, size):
         """This method sets the position for a tooltip that is withhin a
@@ -93,7 +203,10 @@ class ToolTipLabel(Label):
 
             This method is untested in other layouts.
         """
-        pos = list(self.to_window(self.pos[0], self.pos[1], relative=False))
+        if self._win_pos is None:
+            pos = list(self.to_window(self.pos[0], self.pos[1], relative=False))
+        else:
+            pos = list(self._win_pos)
 
         self.tooltip.size = (size[0] + dp(5), size[1])
 
@@ -105,7 +218,7 @@ class ToolTipLabel(Label):
                 self.tooltip.arrow_pos = 'left_bottom'
 
                 # Add spacer so arrow is centered on first line of the text.
-                self.tooltip._arrow_layout.add_widget(Widget(size_hint_y=None, height=dp(4)))
+                self._add_spacer()
 
             else:
                 self.tooltip.arrow_pos = 'left_mid'
@@ -114,12 +227,24 @@ class ToolTipLabel(Label):
 
             if self.tooltip.height > dp(30):
                 self.tooltip.arrow_pos = 'right_bottom'
-                self.tooltip._arrow_layout.add_widget(Widget(size_hint_y=None, height=dp(4)))
+                self._add_spacer()
             else:
                 self.tooltip.arrow_pos = 'right_mid'
 
         self.tooltip.pos = pos
 
+    def _add_spacer(self):
+        """Add the tooltip's arrow spacer unless it is already in place.
+
+            Changing `arrow_pos` rebuilds the arrow layout and drops the spacer;
+            reusing the tooltip with an unchanged `arrow_pos` keeps it.
+        """
+
+        spacer = self.tooltip.spacer
+
+        if spacer.parent is None:
+            self.tooltip._arrow_layout.add_widget(spacer)
+
 
 if __name__ == '__main__':
     from kivy.app import App
@@ -2,6 +2,7 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.properties import StringProperty
 from kivy.core.text import LabelBase
+from icons import iconfonts
 from icons.iconfonts import register
 
 from extend_button_behavior import ExtendedButtonBehavior
@@ -13,6 +14,9 @@ from extend_button_behavior import ExtendedButtonBehavior
     A module for designing `html` inspired text widgets.
 
     Font files are required. Or, roll your own.
+
+    The icon font and `FONTS` are registered on import, so that `icons.iconfonts.icon`,
+    `font_name` and `[font]` markup work before any widget exists.
 """
 
 FONTS = [
@@ -32,10 +36,28 @@ FONTS = [
     },
 ]
 
-register('default_font', 'icons/fontawesome-webfont.ttf', 'icons/font-awesome.fontd')
+# Other modules share this registration; only read the .fontd file once.
+if 'default_font' not in iconfonts._register:
+    register('default_font', 'icons/fontawesome-webfont.ttf', 'icons/font-awesome.fontd')
+
+_fonts_registered = False
+
+
+def register_fonts():
+    """Register `FONTS`. Calls after the first are no-ops."""
+
+    global _fonts_registered
 
-for font in FONTS:
-    LabelBase.register(**font)
+    if _fonts_registered:
+        return
+
+    for font in FONTS:
+        LabelBase.register(**font)
+
+    _fonts_registered = True
+
+
+register_fonts()
 
 
 class Heading(Label):
@@ -96,9 +118,6 @@ class Li(BoxLayout):
     icon_color = StringProperty(None)
     icon_size = StringProperty(None)
 
-    def __init__(self, *args, **kwargs):
-        super(Li, self).__init__(*args, **kwargs)
-
 
 class Link(ExtendedButtonBehavior, P):
     """Provides link behavior to text.